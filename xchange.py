@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
 
+import json
+import math
 import os
+import re
 import sys
-from typing import Dict
-import requests
+import time
+from array import array
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 from colorama import Fore, Style, init
 
 # Initialize colorama for cross-platform support
 init(autoreset=True)
 
+_YELLOW = Fore.YELLOW
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_WHITE = Fore.WHITE
+_BLUE = Fore.BLUE
+_BRIGHT = Style.BRIGHT
+_RESET = Style.RESET_ALL
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
 # ==============================================================================
 # CONSTANTS
 # ==============================================================================
 
 API_URL = "https://api.fxratesapi.com/latest"
-SUPPORTED_EXCHANGES = [
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "xchange")
+CACHE_PATH = os.path.join(CACHE_DIR, "rates.json")
+CACHE_TTL = 600  # seconds
+SUPPORTED_EXCHANGES = (
     "ADA", "AED", "AFN", "ALL", "AMD", "ANG", "AOA", "ARB", "ARS", "AUD", "AWG", "AZN",
     "BAM", "BBD", "BDT", "BGN", "BHD", "BIF", "BMD", "BNB", "BND", "BOB", "BRL", "BSD",
     "BTC", "BTN", "BWP", "BYN", "BYR", "BZD", "CAD", "CDF", "CHF", "CLF", "CLP", "CNY",
@@ -30,13 +49,48 @@ SUPPORTED_EXCHANGES = [
     "SVC", "SYP", "SZL", "THB", "TJS", "TMT", "TND", "TOP", "TRY", "TTD", "TWD", "TZS",
     "UAH", "UGX", "USD", "UYU", "UZS", "VEF", "VND", "VUV", "WST", "XAF", "XAG", "XAU",
     "XCD", "XDR", "XOF", "XPD", "XPF", "XPT", "XRP", "YER", "ZAR", "ZMK", "ZMW", "ZWL"
-]
+)
+SUPPORTED_EXCHANGES_SET = frozenset(SUPPORTED_EXCHANGES)
+CCY_INDEX = {code: i for i, code in enumerate(SUPPORTED_EXCHANGES)}
+EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
+_HTTP_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+# Message box styles: kind -> (text color, border color, prefix)
+_BOX_STYLES = {
+    "success": (_GREEN, _GREEN, "SUCCESS: "),
+    "error": (_RED, _RED, "ERROR: "),
+    "info": (_BLUE, _BLUE, "INFO: "),
+}
+
+# ==============================================================================
+# EXCEPTIONS
+# ==============================================================================
+
+class UnsupportedCurrencyError(ValueError):
+    """Raised when a currency code is not supported or has no exchange rate."""
+
 
 # ==============================================================================
 # UI DECORATION FUNCTIONS
 # ==============================================================================
 
-def create_box(text: str, width: int = 60, color: str = Fore.CYAN, border_color: str = Fore.YELLOW) -> str:
+def visible_len(text: str) -> int:
+    """
+    Measure the on-screen width of text, ignoring ANSI color codes.
+
+    Args:
+        text: Text that may contain ANSI escape sequences
+
+    Returns:
+        Number of visible characters
+    """
+    if '\x1b' not in text:
+        return len(text)
+    return len(_ANSI_RE.sub("", text))
+
+
+def create_box(text: str, width: int = 60, color: str = _CYAN, border_color: str = _YELLOW) -> str:
     """
     Create a decorative box around text with colored borders.
 
@@ -49,22 +103,26 @@ def create_box(text: str, width: int = 60, color: str = Fore.CYAN, border_color:
     Returns:
         Formatted box string
     """
-    lines = text.split('\n')
-    box_width = max(width, max(len(line) for line in lines) + 4)
-
-    result = []
-    # Top border
-    result.append(f"{border_color}╔{'═' * (box_width - 2)}╗{Style.RESET_ALL}")
-
-    # Content lines
-    for line in lines:
-        padding = box_width - len(line) - 3
-        result.append(f"{border_color}║{Style.RESET_ALL} {color}{line}{' ' * padding}{border_color}║{Style.RESET_ALL}")
-
-    # Bottom border
-    result.append(f"{border_color}╚{'═' * (box_width - 2)}╝{Style.RESET_ALL}")
-
-    return '\n'.join(result)
+    if '\n' in text:
+        lines = text.split('\n')
+        widths = [visible_len(line) for line in lines]
+    else:
+        lines = (text,)
+        widths = [visible_len(text)]
+    max_len = max(widths)
+    box_width = max(width, max_len + 4)
+    inner = box_width - 2
+
+    top = f"{border_color}╔{'═' * inner}╗{_RESET}"
+    bottom = f"{border_color}╚{'═' * inner}╝{_RESET}"
+    left = f"{border_color}║{_RESET} {color}"
+    right = f"{border_color}║{_RESET}"
+
+    return '\n'.join([
+        top,
+        *[f"{left}{line}{' ' * (inner - 1 - w)}{right}" for line, w in zip(lines, widths)],
+        bottom,
+    ])
 
 
 def create_header(title: str, subtitle: str = "") -> str:
@@ -78,30 +136,85 @@ def create_header(title: str, subtitle: str = "") -> str:
     Returns:
         Formatted header string
     """
-    header_text = f"{Fore.WHITE}{Style.BRIGHT}{'═' * 20} {title} {'═' * 20}{Style.RESET_ALL}"
+    header_text = f"{_WHITE}{_BRIGHT}{'═' * 20} {title} {'═' * 20}{_RESET}"
     if subtitle:
-        header_text += f"\n{Fore.CYAN}{subtitle}{Style.RESET_ALL}"
-    return create_box(header_text, width=70, color=Fore.WHITE, border_color=Fore.BLUE)
+        header_text += f"\n{_CYAN}{subtitle}{_RESET}"
+    return create_box(header_text, width=70, color=_WHITE, border_color=_BLUE)
 
 
-def create_success_box(text: str) -> str:
-    """Create a green success message box."""
-    return create_box(f"SUCCESS: {Fore.GREEN}{text}{Style.RESET_ALL}", width=50, color=Fore.GREEN, border_color=Fore.GREEN)
+def styled_box(kind: str, text: str) -> str:
+    """
+    Create a message box using one of the predefined styles.
 
+    Args:
+        kind: Style name, one of "success", "error" or "info"
+        text: The message to display
 
-def create_error_box(text: str) -> str:
-    """Create a red error message box."""
-    return create_box(f"ERROR: {Fore.RED}{text}{Style.RESET_ALL}", width=50, color=Fore.RED, border_color=Fore.RED)
+    Returns:
+        Formatted box string
+    """
+    color, border_color, prefix = _BOX_STYLES[kind]
+    return create_box(f"{prefix}{color}{text}{_RESET}", width=50, color=color, border_color=border_color)
 
 
-def create_info_box(text: str) -> str:
-    """Create a blue info message box."""
-    return create_box(f"INFO: {Fore.BLUE}{text}{Style.RESET_ALL}", width=50, color=Fore.BLUE, border_color=Fore.BLUE)
+def clear_screen(text: str = "") -> None:
+    """
+    Clear the terminal screen, optionally drawing text in the same write.
 
+    Colorama translates the ANSI codes on Windows.
 
-def clear_screen() -> None:
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    Args:
+        text: Text to display on the cleared screen
+    """
+    sys.stdout.write(_CLEAR_SCREEN + text)
+    sys.stdout.flush()
+
+
+def press_any_key() -> None:
+    """
+    Block until a single key is pressed.
+
+    Falls back to reading a full line when stdin is not a terminal.
+
+    Raises:
+        KeyboardInterrupt: If Ctrl+C is pressed while waiting
+    """
+    if not sys.stdin.isatty():
+        sys.stdin.readline()
+        return
+
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getch()
+    else:
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            # Read generously so multi-byte keys (e.g. arrows) are consumed whole
+            key = os.read(fd, 32)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+    if key.startswith(b'\x03'):
+        raise KeyboardInterrupt
+
+
+def wait_for_user(message: str) -> None:
+    """
+    Show a message followed by a continue prompt and wait for a keypress.
+
+    The message and prompt are written together to avoid an extra flush.
+
+    Args:
+        message: Text to display above the prompt
+    """
+    sys.stdout.write(f"{message}\n\n{_CYAN}Press any key to continue...{_RESET}")
+    sys.stdout.flush()
+    press_any_key()
 
 
 def get_colored_input(prompt: str) -> str:
@@ -114,13 +227,65 @@ def get_colored_input(prompt: str) -> str:
     Returns:
         User input string
     """
-    return input(f"{Fore.YELLOW}{prompt}{Style.RESET_ALL}").strip()
+    return input(f"{_YELLOW}{prompt}{_RESET}").strip()
+
+
+# Static screens rendered once at import instead of on every loop iteration
+_MAIN_SCREEN = (
+    create_header("CURRENCY CONVERTER", "Real-time exchange rates powered by fxratesapi.com")
+    + f"\n\n{_CYAN}(Type 'exit' or 'q' to quit){_RESET}\n\n"
+)
+_GOODBYE_HEADER = create_header(" GOODBYE! ", "Thank you for using Currency Converter")
+_FETCHING_BOX = styled_box("info", "Fetching latest exchange rates...")
 
 
 # ==============================================================================
 # BUSINESS LOGIC FUNCTIONS
 # ==============================================================================
 
+@lru_cache(maxsize=None)
+def get_http_client() -> Tuple[object, Tuple[type, ...]]:
+    """
+    Create the shared HTTP client on first use.
+
+    The HTTP stack is imported here rather than at module level so startup
+    stays fast when rates come from the cache. httpx over HTTP/2 is preferred
+    when installed with h2 support, otherwise a pooled requests session is used.
+    Reusing the client keeps the keep-alive connection across fetches.
+
+    Returns:
+        Tuple of (client, exception types raised by the client on failure)
+    """
+    try:
+        import httpx
+
+        client = httpx.Client(http2=True, timeout=10.0, headers=_HTTP_HEADERS)
+        return client, (httpx.HTTPError,)
+    except ImportError:  # httpx/h2 are optional; fall back to requests
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update(_HTTP_HEADERS)
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=1))
+        return session, (requests.RequestException,)
+
+
+@lru_cache(maxsize=None)
+def get_json_loads() -> Callable:
+    """
+    Pick the JSON parser for API responses on first use.
+
+    Returns:
+        orjson.loads when orjson is installed, otherwise json.loads
+    """
+    try:
+        from orjson import loads
+    except ImportError:  # orjson is optional; fall back to the stdlib parser
+        loads = json.loads
+    return loads
+
+
 def fetch_exchange_rates() -> Dict[str, float]:
     """
     Fetch current exchange rates from the API.
@@ -131,27 +296,90 @@ def fetch_exchange_rates() -> Dict[str, float]:
     Raises:
         SystemExit: If API request fails
     """
+    client, http_errors = get_http_client()
     try:
-        response = requests.get(API_URL, timeout=10)
+        response = client.get(API_URL, timeout=10)
         response.raise_for_status()
 
-        api_response = response.json()
+        api_response = get_json_loads()(response.content)
         rates = api_response.get("rates", {})
 
         if not rates:
-            print(create_error_box("No exchange rates data received from API"))
+            print(styled_box("error", "No exchange rates data received from API"))
             sys.exit(1)
 
         return rates
 
-    except requests.RequestException as e:
-        print(create_error_box(f"Error fetching data from API: {str(e)}"))
+    except http_errors as e:
+        print(styled_box("error", f"Error fetching data from API: {str(e)}"))
         sys.exit(1)
     except ValueError as e:
-        print(create_error_box(f"Error parsing API response: {str(e)}"))
+        print(styled_box("error", f"Error parsing API response: {str(e)}"))
         sys.exit(1)
 
 
+def load_cached_rates(ttl: Optional[int] = CACHE_TTL) -> Optional[Dict[str, float]]:
+    """
+    Load exchange rates from the local cache if they are still fresh.
+
+    Args:
+        ttl: Maximum age of the cached rates in seconds, or None to accept any age
+
+    Returns:
+        Dictionary of cached exchange rates, or None if missing, stale or malformed
+    """
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(CACHE_PATH) >= ttl:
+            return None
+        with open(CACHE_PATH, encoding="utf-8") as cache_file:
+            rates = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    # Treat a cache that doesn't hold a currency -> rate mapping as a miss
+    if not isinstance(rates, dict) or not all(isinstance(rate, (int, float)) for rate in rates.values()):
+        return None
+
+    return rates or None
+
+
+def save_cached_rates(rates: Dict[str, float]) -> None:
+    """
+    Persist exchange rates to the local cache.
+
+    The file is written to a temporary path and atomically moved into place
+    so a concurrent reader never sees a partial payload. Failures are ignored
+    since the cache is only an optimization.
+
+    Args:
+        rates: Dictionary of exchange rates to store
+    """
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(rates, cache_file)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def build_rate_table(rates: Dict[str, float]) -> array:
+    """
+    Build a contiguous rate table indexed by position in SUPPORTED_EXCHANGES.
+
+    Args:
+        rates: Dictionary of exchange rates
+
+    Returns:
+        Array of float64 rates; currencies missing from the API get 0.0
+    """
+    return array("d", (float(rates.get(code) or 0.0) for code in SUPPORTED_EXCHANGES))
+
+
 def validate_currency(currency: str) -> bool:
     """
     Validate if a currency code is supported.
@@ -162,10 +390,10 @@ def validate_currency(currency: str) -> bool:
     Returns:
         True if currency is supported, False otherwise
     """
-    return currency.upper() in SUPPORTED_EXCHANGES
+    return currency.upper() in SUPPORTED_EXCHANGES_SET
 
 
-def convert_currency(amount: float, from_currency: str, to_currency: str, rates: Dict[str, float]) -> float:
+def convert_currency(amount: float, from_currency: str, to_currency: str, rate_table: array) -> float:
     """
     Convert an amount from one currency to another.
 
@@ -173,38 +401,106 @@ def convert_currency(amount: float, from_currency: str, to_currency: str, rates:
         amount: Amount to convert
         from_currency: Source currency code
         to_currency: Target currency code
-        rates: Dictionary of exchange rates
+        rate_table: Rate table built by build_rate_table
 
     Returns:
         Converted amount
 
     Raises:
-        SystemExit: If currency validation fails
+        UnsupportedCurrencyError: If a currency is unsupported or has no rate
     """
     from_currency = from_currency.upper()
     to_currency = to_currency.upper()
 
-    if not validate_currency(from_currency) or not validate_currency(to_currency):
-        print(create_error_box("Unsupported currency"))
-        sys.exit(1)
+    for currency in (from_currency, to_currency):
+        if not validate_currency(currency):
+            raise UnsupportedCurrencyError(f"Unsupported currency: {currency}")
 
-    try:
-        from_rate = rates[from_currency]
-        to_rate = rates[to_currency]
+    from_rate = rate_table[CCY_INDEX[from_currency]]
+    to_rate = rate_table[CCY_INDEX[to_currency]]
 
-        if from_rate == 0:
-            print(create_error_box(f"Exchange rate for {from_currency} is not available"))
-            sys.exit(1)
+    if from_rate == 0:
+        raise UnsupportedCurrencyError(f"Exchange rate for {from_currency} is not available")
+    if to_rate == 0:
+        raise UnsupportedCurrencyError(f"Exchange rate not available for currency: {to_currency}")
 
-        converted_amount = (amount / from_rate) * to_rate
-        return converted_amount
+    return amount * to_rate / from_rate
 
-    except KeyError as e:
-        print(create_error_box(f"Exchange rate not available for currency: {str(e)}"))
-        sys.exit(1)
-    except ZeroDivisionError:
-        print(create_error_box("Invalid exchange rate (division by zero)"))
-        sys.exit(1)
+
+@lru_cache(maxsize=None)
+def get_convert_many() -> Callable:
+    """
+    Build the batch conversion kernel on first use.
+
+    numba is imported here rather than at module level since it is slow to
+    import and the interactive path never needs it. When numba is not
+    installed the kernel runs as a plain Python loop.
+
+    The kernel has the signature ``convert_many(amounts, from_idx, to_idx,
+    rate_table, out)``: it converts ``amounts`` in place into ``out``, using
+    indices into a rate table built by build_rate_table (see CCY_INDEX).
+    Pairs involving a currency without a rate produce NaN. ``out`` must be a
+    writable float buffer such as ``array("d")``, whether or not numba is
+    installed; a list is rejected rather than silently left unfilled.
+
+    >>> rate_table = build_rate_table({"USD": 1.0, "EUR": 0.9})
+    >>> out = array("d", [0.0, 0.0])
+    >>> get_convert_many()(array("d", [10.0, 10.0]),
+    ...                    array("q", [CCY_INDEX["USD"], CCY_INDEX["USD"]]),
+    ...                    array("q", [CCY_INDEX["EUR"], CCY_INDEX["GBP"]]),
+    ...                    rate_table, out)
+    >>> out[0], math.isnan(out[1])
+    (9.0, True)
+    >>> get_convert_many()([10.0], [CCY_INDEX["USD"]], [CCY_INDEX["EUR"]], rate_table, [0.0])
+    Traceback (most recent call last):
+        ...
+    TypeError: out must be a writable buffer, such as array("d")
+
+    Returns:
+        The (possibly JIT-compiled) convert_many kernel
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; fall back to a plain Python loop
+        njit = None
+        prange = range
+
+    def convert_many(amounts, from_idx, to_idx, rate_table, out):
+        for i in prange(len(amounts)):
+            from_rate = rate_table[from_idx[i]]
+            to_rate = rate_table[to_idx[i]]
+            if from_rate == 0.0 or to_rate == 0.0:
+                out[i] = math.nan
+            else:
+                out[i] = amounts[i] * to_rate / from_rate
+
+    if njit is None:
+        kernel = convert_many
+    else:
+        import numpy as np
+
+        # fastmath without the no-NaN/no-inf flags, so the NaN written above stays defined
+        fastmath = {"nsz", "arcp", "contract", "afn", "reassoc"}
+        jitted = njit(parallel=True, fastmath=fastmath, error_model="numpy", cache=True)(convert_many)
+
+        def kernel(amounts, from_idx, to_idx, rate_table, out):
+            # prange needs ndarrays; np.asarray views array.array buffers without copying
+            out_arr = np.asarray(out)
+            if not np.shares_memory(out_arr, out):
+                raise TypeError('out must be a writable buffer, such as array("d")')
+            jitted(np.asarray(amounts), np.asarray(from_idx), np.asarray(to_idx),
+                   np.asarray(rate_table), out_arr)
+
+    def checked_convert_many(amounts, from_idx, to_idx, rate_table, out):
+        try:
+            writable = not memoryview(out).readonly
+        except TypeError:
+            writable = False
+        if not writable:
+            raise TypeError('out must be a writable buffer, such as array("d")')
+        kernel(amounts, from_idx, to_idx, rate_table, out)
+
+    return checked_convert_many
 
 
 def format_conversion_result(amount: float, from_currency: str, to_currency: str, converted_amount: float) -> str:
@@ -220,7 +516,7 @@ def format_conversion_result(amount: float, from_currency: str, to_currency: str
     Returns:
         Formatted result string
     """
-    return f"{Fore.YELLOW}{amount} {from_currency}{Style.RESET_ALL} {Fore.WHITE}is equal to{Style.RESET_ALL} {Fore.GREEN}{converted_amount:.2f} {to_currency}{Style.RESET_ALL}"
+    return f"{_YELLOW}{amount} {from_currency}{_RESET} {_WHITE}is equal to{_RESET} {_GREEN}{converted_amount:.2f} {to_currency}{_RESET}"
 
 
 # ==============================================================================
@@ -229,7 +525,7 @@ def format_conversion_result(amount: float, from_currency: str, to_currency: str
 
 def display_conversion_result(amount: float, from_currency: str, to_currency: str, converted_amount: float) -> None:
     """
-    Display the conversion result in a decorated box.
+    Display the conversion result in a decorated box and wait for the user.
 
     Args:
         amount: Original amount
@@ -238,12 +534,12 @@ def display_conversion_result(amount: float, from_currency: str, to_currency: st
         converted_amount: Converted amount
     """
     result_text = format_conversion_result(amount, from_currency, to_currency, converted_amount)
-    print(create_success_box(result_text))
+    wait_for_user(styled_box("success", result_text))
 
 
 def handle_user_exit() -> None:
     """Handle graceful user exit with goodbye message."""
-    print(create_header(" GOODBYE! ", "Thank you for using Currency Converter"))
+    print(_GOODBYE_HEADER)
     sys.exit(0)
 
 
@@ -261,42 +557,73 @@ def get_user_amount() -> float:
     return float(amount_input)
 
 
-def run_conversion_loop(rates: Dict[str, float]) -> None:
+def read_currency(prompt: str) -> str:
     """
-    Main interactive loop for currency conversion.
+    Read a currency code from the user, handling exit commands.
 
     Args:
-        rates: Dictionary of exchange rates
+        prompt: The prompt text to display
+
+    Returns:
+        Upper-cased, supported currency code
+
+    Raises:
+        UnsupportedCurrencyError: If the code is not supported
+    """
+    # Interned so set lookups against the (already interned) codes hit by identity
+    currency = sys.intern(get_colored_input(prompt).upper())
+    if currency.lower() in EXIT_COMMANDS:
+        handle_user_exit()
+    if currency not in SUPPORTED_EXCHANGES_SET:
+        raise UnsupportedCurrencyError(f"Unsupported currency: {currency}")
+    return currency
+
+
+def prompt_currency(prompt: str) -> str:
+    """
+    Prompt for a currency code until a supported one is entered.
+
+    Args:
+        prompt: The prompt text to display
+
+    Returns:
+        Upper-cased, supported currency code
     """
     while True:
-        clear_screen()
-        print(create_header("CURRENCY CONVERTER", "Real-time exchange rates powered by fxratesapi.com"))
-        print(f"\n{Fore.CYAN}(Type 'exit' to quit){Style.RESET_ALL}\n")
+        try:
+            return read_currency(prompt)
+        except UnsupportedCurrencyError as e:
+            print(styled_box("error", str(e)))
+
+
+def run_conversion_loop(rate_table: array) -> None:
+    """
+    Main interactive loop for currency conversion.
 
-        # Get source currency
-        from_currency_input = get_colored_input("Enter source currency (e.g., USD): ")
-        if from_currency_input.lower() == "exit":
-            handle_user_exit()
+    Args:
+        rate_table: Rate table built by build_rate_table
+    """
+    while True:
+        clear_screen(_MAIN_SCREEN)
 
-        # Get target currency
-        to_currency_input = get_colored_input("Enter target currency (e.g., EUR): ")
-        if to_currency_input.lower() == "exit":
-            handle_user_exit()
+        # Get source and target currencies, re-prompting on unsupported codes
+        from_currency = prompt_currency("Enter source currency (e.g., USD): ")
+        to_currency = prompt_currency("Enter target currency (e.g., EUR): ")
 
         # Get amount and validate
         try:
             amount = get_user_amount()
         except ValueError:
-            print(create_error_box("Invalid amount. Please enter a number."))
-            input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+            wait_for_user(styled_box("error", "Invalid amount. Please enter a number."))
             continue
 
-        # Perform conversion and display result
-        converted_amount = convert_currency(amount, from_currency_input, to_currency_input, rates)
-        display_conversion_result(amount, from_currency_input.upper(), to_currency_input.upper(), converted_amount)
-
-        # Wait for user before continuing
-        input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+        # Perform conversion, display result and wait for user before continuing
+        try:
+            converted_amount = convert_currency(amount, from_currency, to_currency, rate_table)
+        except UnsupportedCurrencyError as e:
+            wait_for_user(styled_box("error", str(e)))
+            continue
+        display_conversion_result(amount, from_currency, to_currency, converted_amount)
 
 
 def main() -> None:
@@ -304,18 +631,29 @@ def main() -> None:
     Main entry point for the currency converter application.
     """
     try:
-        # Fetch exchange rates once at startup
-        print(create_info_box("Fetching latest exchange rates..."))
-        rates = fetch_exchange_rates()
+        # Use cached rates when fresh, otherwise fetch once at startup
+        rates = load_cached_rates()
+        if rates is None:
+            print(_FETCHING_BOX)
+            try:
+                rates = fetch_exchange_rates()
+            except SystemExit:
+                # Fall back to stale cached rates so the converter still works offline
+                rates = load_cached_rates(ttl=None)
+                if rates is None:
+                    raise
+                print(styled_box("info", "Using cached exchange rates, which may be stale"))
+            else:
+                save_cached_rates(rates)
 
         # Start the interactive conversion loop
-        run_conversion_loop(rates)
+        run_conversion_loop(build_rate_table(rates))
 
     except KeyboardInterrupt:
-        print(create_info_box("Operation cancelled by user"))
+        print(styled_box("info", "Operation cancelled by user"))
         handle_user_exit()
     except Exception as e:
-        print(create_error_box(f"Unexpected error: {str(e)}"))
+        print(styled_box("error", f"Unexpected error: {str(e)}"))
         sys.exit(1)
 
 